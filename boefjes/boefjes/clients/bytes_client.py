@@ -6,7 +6,7 @@ from functools import wraps
 from typing import Any
 
 import structlog
-from httpx import Client, HTTPStatusError, HTTPTransport, Response
+from httpx import Client, HTTPStatusError, HTTPTransport, Limits, Response
 
 from boefjes.config import settings
 from boefjes.worker.interfaces import BoefjeOutput, BoefjeStorageInterface
@@ -40,6 +40,7 @@ class BytesAPIClient(BoefjeStorageInterface):
             headers={"User-Agent": f"bytes-api-client/{BYTES_API_CLIENT_VERSION}"},
             transport=(HTTPTransport(retries=6)),
             timeout=settings.outgoing_request_timeout,
+            limits=Limits(max_keepalive_connections=20, keepalive_expiry=30),
         )
 
         self.credentials = {"username": username, "password": password}
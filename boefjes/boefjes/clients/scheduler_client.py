@@ -6,7 +6,7 @@ from typing import Any
 
 import httpx
 import structlog
-from httpx import Client, HTTPError, HTTPTransport, Response
+from httpx import Client, HTTPError, HTTPTransport, Limits, Response
 from jsonschema import ValidationError
 from jsonschema.validators import validate
 from pydantic import TypeAdapter
@@ -31,7 +31,10 @@ class SchedulerAPIClient(SchedulerClientInterface):
         plugins: list[str] | None = None,
     ):
         self._session = Client(
-            base_url=base_url, transport=HTTPTransport(retries=6), timeout=settings.outgoing_request_timeout
+            base_url=base_url,
+            transport=HTTPTransport(retries=6),
+            timeout=settings.outgoing_request_timeout,
+            limits=Limits(max_keepalive_connections=20, keepalive_expiry=30),
         )
         self.plugin_service = plugin_service
         self.oci_images = oci_images
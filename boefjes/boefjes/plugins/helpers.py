@@ -1,3 +1,11 @@
+import json
+from collections.abc import Callable, Iterable
+
+from boefjes.normalizer_models import NormalizerOutput
+from octopoes.models import Reference
+from octopoes.models.ooi.findings import Finding, FindingType
+
+
 def cpe_to_name_version(cpe: str) -> tuple[str | None, str | None]:
     """Fetch the software name and version from a CPE string."""
     cpe_split = cpe.split(":")
@@ -5,3 +13,26 @@ def cpe_to_name_version(cpe: str) -> tuple[str | None, str | None]:
     name = None if cpe_split_len < 4 else cpe_split[3]
     version = None if cpe_split_len < 5 else cpe_split[4]
     return name, version
+
+
+def normalize_nuclei_output(
+    input_ooi: dict, raw: bytes, to_finding_type: Callable[[dict], tuple[FindingType, str]]
+) -> Iterable[NormalizerOutput]:
+    """Yield findings for each line of nuclei JSONL output.
+
+    The ``to_finding_type`` callable maps a parsed result line to the finding type
+    and description for that result, so the nuclei normalizers can share this loop.
+    """
+    url_reference = Reference.from_str(input_ooi["primary_key"])
+    if raw:
+        for line in raw.splitlines():
+            data = json.loads(line)
+            finding_type, description = to_finding_type(data)
+            yield finding_type
+            yield Finding(
+                finding_type=finding_type.reference,
+                ooi=url_reference,
+                proof=data["curl-command"],
+                description=description,
+                reproduce=None,
+            )
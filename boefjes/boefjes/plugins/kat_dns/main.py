@@ -1,5 +1,6 @@
 """Boefje script for getting dns records"""
 
+import functools
 import json
 import logging
 import re
@@ -32,16 +33,24 @@ def get_record_types() -> set[str]:
     return set(parsed_requested_record_types).intersection(DEFAULT_RECORD_TYPES)
 
 
-def run(boefje_meta: dict) -> list[tuple[set, bytes | str]]:
-    hostname = boefje_meta["arguments"]["input"]["name"]
-
-    requested_dns_name = dns.name.from_text(hostname)
+@functools.lru_cache(maxsize=8)
+def get_resolver(nameserver: str) -> dns.resolver.Resolver:
     resolver = dns.resolver.Resolver()
     # https://dnspython.readthedocs.io/en/stable/_modules/dns/edns.html
     # enable EDE to get the DNSSEC Bogus return values if the server supports it # codespell-ignore
     resolver.use_edns(options=[EDEOption(15)])
-    nameserver = getenv("REMOTE_NS", "1.1.1.1")
     resolver.nameservers = [nameserver]
+    # Answers are cached per nameserver and expire with their TTL, so repeated lookups
+    # of the same names (parent-zone walks, rescans) skip the network round-trip
+    resolver.cache = dns.resolver.LRUCache(10000)
+    return resolver
+
+
+def run(boefje_meta: dict) -> list[tuple[set, bytes | str]]:
+    hostname = boefje_meta["arguments"]["input"]["name"]
+
+    requested_dns_name = dns.name.from_text(hostname)
+    resolver = get_resolver(getenv("REMOTE_NS", "1.1.1.1"))
 
     record_types = get_record_types()
     answers = [get_parent_zone_soa(resolver, requested_dns_name)] if "SOA" in record_types else []
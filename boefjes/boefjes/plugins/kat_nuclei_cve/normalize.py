@@ -1,30 +1,13 @@
-import json
 from collections.abc import Iterable
 
 from boefjes.normalizer_models import NormalizerOutput
-from octopoes.models import Reference
-from octopoes.models.ooi.findings import CVEFindingType, Finding
+from boefjes.plugins.helpers import normalize_nuclei_output
+from octopoes.models.ooi.findings import CVEFindingType, FindingType
 
 
-def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
-    url_reference = Reference.from_str(input_ooi["primary_key"])
-    if raw:
-        for line in raw.splitlines():
-            # Extract and parse values
-            data = json.loads(line)
-            id_ = data["info"]["classification"]["cve-id"][0].upper()
-            description = data["info"]["description"]
-            curl_command = data["curl-command"]
+def to_finding_type(data: dict) -> tuple[FindingType, str]:
+    return CVEFindingType(id=data["info"]["classification"]["cve-id"][0].upper()), data["info"]["description"]
 
-            # Create instances of CVEFindingType and Finding classes
-            cve_finding_type = CVEFindingType(id=id_)
-            yield cve_finding_type
 
-            finding = Finding(
-                finding_type=cve_finding_type.reference,
-                ooi=url_reference,
-                proof=curl_command,
-                description=description,
-                reproduce=None,  # Set this attribute if you have a reproduce value
-            )
-            yield finding
+def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
+    yield from normalize_nuclei_output(input_ooi, raw, to_finding_type)
@@ -14,16 +14,17 @@ from octopoes.models.ooi.web import URL, SecurityTXT, Website
 def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
     results = json.loads(raw)
     website_original = Reference.from_str(input_ooi["primary_key"])
+    network_reference = Network(name=input_ooi["hostname"]["network"]["name"]).reference
 
     for path, details in results.items():
         if details["content"] is None:
             continue
         url_original = URL(
             raw=f'{input_ooi["ip_service"]["service"]["name"]}://{input_ooi["hostname"]["name"]}/{path}',
-            network=Network(name=input_ooi["hostname"]["network"]["name"]).reference,
+            network=network_reference,
         )
         yield url_original
-        url = URL(raw=details["url"], network=Network(name=input_ooi["hostname"]["network"]["name"]).reference)
+        url = URL(raw=details["url"], network=network_reference)
         yield url
         url_parts = urlparse(details["url"])
         # we need to check if the website of the response is the same as the input website
@@ -38,19 +39,13 @@ def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
             yield security_txt
         # otherwise we need to create a new website complete with hostname and ip
         else:
-            hostname = Hostname(
-                name=url_parts.netloc, network=Network(name=input_ooi["hostname"]["network"]["name"]).reference
-            )
+            hostname = Hostname(name=url_parts.netloc, network=network_reference)
             yield hostname
             addr = ipaddress.ip_address(details["ip"])
             if addr.version == 6:
-                ip_address = IPAddressV6(
-                    address=details["ip"], network=Network(name=input_ooi["hostname"]["network"]["name"]).reference
-                )
+                ip_address = IPAddressV6(address=details["ip"], network=network_reference)
             else:
-                ip_address = IPAddressV4(
-                    address=details["ip"], network=Network(name=input_ooi["hostname"]["network"]["name"]).reference
-                )
+                ip_address = IPAddressV4(address=details["ip"], network=network_reference)
             yield ip_address
             # check scheme for service and ipport
             if url_parts.scheme == "https":
@@ -1,4 +1,5 @@
 import datetime
+import functools
 import ipaddress
 import logging
 import re
@@ -34,6 +35,16 @@ def find_between(s: str, first: str, last: str) -> str:
         return ""
 
 
+@functools.lru_cache(maxsize=512)
+def load_certificate(pem_contents: str) -> x509.Certificate:
+    """Parse a PEM certificate, caching on the PEM contents.
+
+    The same intermediate and root certificates show up in the chains of many
+    websites, so within a worker process most chains only differ in their leaf.
+    """
+    return x509.load_pem_x509_certificate(pem_contents.encode(), default_backend())
+
+
 def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
     # only get the first part of certificates
     contents = find_between(raw.decode(), "Certificate chain", "Certificate chain")
@@ -97,13 +108,14 @@ def read_certificates(
     # iterate through the PEM certificates and decode them
     certificates = []
     certificate_subject_alternative_names = []
-    hostnames = []
+    # keyed by hostname so the same SAN on multiple certificates in the chain yields one OOI
+    hostnames: dict[str, Hostname] = {}
     for m in re.finditer(
         r"(?<=-----BEGIN CERTIFICATE-----).*?(?=-----END CERTIFICATE-----)", contents, flags=re.DOTALL
     ):
         pem_contents = f"-----BEGIN CERTIFICATE-----{m.group()}-----END CERTIFICATE-----"
 
-        cert = x509.load_pem_x509_certificate(pem_contents.encode(), default_backend())
+        cert = load_certificate(pem_contents)
         try:
             subject = cert.subject.get_attributes_for_oid(x509.OID_COMMON_NAME)[0].value
         except IndexError:
@@ -117,14 +129,15 @@ def read_certificates(
             subject_alternative_names = []
         valid_from = cert.not_valid_before.isoformat()
         valid_until = cert.not_valid_after.isoformat()
-        pk_size = cert.public_key().key_size
-        logging.info("Parsing certificate of type %s", type(cert.public_key()))
-        if isinstance(cert.public_key(), rsa.RSAPublicKey):
+        public_key = cert.public_key()
+        pk_size = public_key.key_size
+        logging.info("Parsing certificate of type %s", type(public_key))
+        if isinstance(public_key, rsa.RSAPublicKey):
             pk_algorithm = str(AlgorithmType.RSA)
-            pk_number = cert.public_key().public_numbers().n.to_bytes(pk_size // 8, "big").hex()
-        elif isinstance(cert.public_key(), ec.EllipticCurvePublicKey):
+            pk_number = public_key.public_numbers().n.to_bytes(pk_size // 8, "big").hex()
+        elif isinstance(public_key, ec.EllipticCurvePublicKey):
             pk_algorithm = str(AlgorithmType.ECC)
-            pk_number = hex(cert.public_key().public_numbers().x) + hex(cert.public_key().public_numbers().y)
+            pk_number = hex(public_key.public_numbers().x) + hex(public_key.public_numbers().y)
         else:
             pk_algorithm = None
             pk_number = None
@@ -152,8 +165,7 @@ def read_certificates(
             san = None
             if isinstance(name, str):
                 if "*" not in name:
-                    hostname = Hostname(network=network_reference, name=name)
-                    hostnames.append(hostname)
+                    hostname = hostnames.setdefault(name, Hostname(network=network_reference, name=name))
                     san = SubjectAlternativeNameHostname(hostname=hostname.reference, certificate=certificate_reference)
                 else:
                     san = SubjectAlternativeNameQualifier(name=name, certificate=certificate_reference)
@@ -169,4 +181,4 @@ def read_certificates(
             if san is not None:
                 certificate_subject_alternative_names.append(san)
 
-    return certificates, certificate_subject_alternative_names, hostnames
+    return certificates, certificate_subject_alternative_names, list(hostnames.values())
@@ -1,4 +1,4 @@
-from collections.abc import Iterable
+from collections.abc import Callable, Iterable
 
 import defusedxml.ElementTree as ET
 
@@ -6,6 +6,22 @@ from boefjes.normalizer_models import NormalizerOutput
 from octopoes.models import Reference
 from octopoes.models.ooi.findings import Finding, KATFindingType
 
+Protocols = list[tuple[str, str, bool]]
+
+# Ordered and mutually exclusive: only the first matching check yields a finding
+TLS_PROTOCOL_CHECKS: list[tuple[str, Callable[[Protocols], bool]]] = [
+    ("KAT-SSL-2-SUPPORT", lambda protocols: ("ssl", "2", True) in protocols),
+    ("KAT-SSL-3-SUPPORT", lambda protocols: ("ssl", "3", True) in protocols),
+    ("KAT-TLS-1.0-SUPPORT", lambda protocols: ("tls", "1.0", True) in protocols and ("tls", "1.1", False) in protocols),
+    ("KAT-TLS-1.1-SUPPORT", lambda protocols: ("tls", "1.1", True) in protocols and ("tls", "1.0", False) in protocols),
+    (
+        "KAT-TLS-1.0-AND-1.1-SUPPORT",
+        lambda protocols: ("tls", "1.0", True) in protocols and ("tls", "1.1", True) in protocols,
+    ),
+    ("KAT-NO-TLS-1.2", lambda protocols: ("tls", "1.2", False) in protocols),
+    ("KAT-NO-TLS-1.3", lambda protocols: ("tls", "1.3", False) in protocols),
+]
+
 
 def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
     root = ET.fromstring(raw)
@@ -25,34 +41,12 @@ def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
         # finding for this.
         return
 
-    if ("ssl", "2", True) in protocols:
-        kft = KATFindingType(id="KAT-SSL-2-SUPPORT")
-        yield kft
-        yield Finding(finding_type=kft.reference, ooi=website_reference)
-    elif ("ssl", "3", True) in protocols:
-        kft = KATFindingType(id="KAT-SSL-3-SUPPORT")
-        yield kft
-        yield Finding(finding_type=kft.reference, ooi=website_reference)
-    elif ("tls", "1.0", True) in protocols and ("tls", "1.1", False) in protocols:
-        kft = KATFindingType(id="KAT-TLS-1.0-SUPPORT")
-        yield kft
-        yield Finding(finding_type=kft.reference, ooi=website_reference)
-    elif ("tls", "1.1", True) in protocols and ("tls", "1.0", False) in protocols:
-        kft = KATFindingType(id="KAT-TLS-1.1-SUPPORT")
-        yield kft
-        yield Finding(finding_type=kft.reference, ooi=website_reference)
-    elif ("tls", "1.0", True) in protocols and ("tls", "1.1", True) in protocols:
-        kft = KATFindingType(id="KAT-TLS-1.0-AND-1.1-SUPPORT")
-        yield kft
-        yield Finding(finding_type=kft.reference, ooi=website_reference)
-    elif ("tls", "1.2", False) in protocols:
-        kft = KATFindingType(id="KAT-NO-TLS-1.2")
-        yield kft
-        yield Finding(finding_type=kft.reference, ooi=website_reference)
-    elif ("tls", "1.3", False) in protocols:
-        kft = KATFindingType(id="KAT-NO-TLS-1.3")
-        yield kft
-        yield Finding(finding_type=kft.reference, ooi=website_reference)
+    for finding_type_id, is_applicable in TLS_PROTOCOL_CHECKS:
+        if is_applicable(protocols):
+            kft = KATFindingType(id=finding_type_id)
+            yield kft
+            yield Finding(finding_type=kft.reference, ooi=website_reference)
+            break
 
     fallback = root.find("./ssltest/fallback")
     if fallback is not None and fallback.attrib["supported"] != "1":
@@ -1,8 +1,8 @@
+import functools
 from collections.abc import Iterable
 from pathlib import Path
 from typing import cast
 
-import httpx
 from tanimachi import (
     Categories,
     Fingerprints,
@@ -33,6 +33,23 @@ from octopoes.models.ooi.network import Network
 from octopoes.models.ooi.software import Software, SoftwareInstance
 from octopoes.models.ooi.web import HostnameHTTPURL
 
+DATA_DIRECTORY = Path(__file__).parent / "data"
+
+
+@functools.cache
+def get_wappalyzer() -> Wappalyzer:
+    """Load and compile the fingerprint database once per process, on first use.
+
+    Validating the hundreds of technologies/*.json files is by far the most expensive part of a
+    run, so it should not be repeated per HAR, but it should not slow down importing this module
+    (and thereby normalizer discovery) either.
+    """
+    return Wappalyzer(
+        Fingerprints.model_validate_pattern(DATA_DIRECTORY.joinpath("technologies/*.json").as_posix()),
+        categories=Categories.model_validate_file(DATA_DIRECTORY.joinpath("categories.json")),
+        groups=Groups.model_validate_file(DATA_DIRECTORY.joinpath("groups.json")),
+    )
+
 
 def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
     pk = input_ooi["primary_key"]
@@ -49,15 +66,8 @@ def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
         path=tokenized_weburl["path"],
     )
 
-    data_directory = Path(__file__).parent / "data"
-    fingerprints = Fingerprints.model_validate_pattern(data_directory.joinpath("technologies/*.json").as_posix())
-    categories = Categories.model_validate_file(data_directory.joinpath("categories.json"))
-    groups = Groups.model_validate_file(data_directory.joinpath("groups.json"))
-    httpx.HTTPTransport()
     har = Har.model_validate_json(raw)
 
-    wappalyzer = Wappalyzer(fingerprints, categories=categories, groups=groups)
-
     analyzes = [analyze_scripts, analyze_css]
 
     # check if the content type is html
@@ -74,7 +84,7 @@ def run(input_ooi: dict, raw: bytes) -> Iterable[NormalizerOutput]:
             ]
         )
 
-    detections = cast(list[Detection], wappalyzer.analyze(har, analyzes=analyzes))
+    detections = cast(list[Detection], get_wappalyzer().analyze(har, analyzes=analyzes))
 
     for detection in detections:
         version = None
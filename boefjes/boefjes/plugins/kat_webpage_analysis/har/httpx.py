@@ -10,6 +10,9 @@ from typing import AnyStr
 
 import httpx
 
+# Resolving the local timezone is surprisingly expensive; do it once instead of per cookie
+LOCAL_TIMEZONE = datetime.now().astimezone().tzinfo
+
 
 def create_har_object(response: httpx.Response) -> dict:
     return {
@@ -19,7 +22,7 @@ def create_har_object(response: httpx.Response) -> dict:
             "browser": {"name": "httpx", "version": httpx.__version__},
             "entries": [
                 {
-                    "startedDateTime": datetime.now().astimezone().isoformat(),  #
+                    "startedDateTime": datetime.now(tz=LOCAL_TIMEZONE).isoformat(),
                     "time": 0,
                     "request": map_request(response.request),
                     "response": map_response(response),
@@ -84,7 +87,7 @@ def map_cookie(cookie: Cookie) -> dict:
         "value": cookie.value,
         "path": cookie.path,
         "domain": cookie.domain,
-        "expires": (datetime.fromtimestamp(cookie.expires).astimezone().isoformat() if cookie.expires else None),
+        "expires": (datetime.fromtimestamp(cookie.expires, tz=LOCAL_TIMEZONE).isoformat() if cookie.expires else None),
         "httpOnly": False,  # Assuming httpOnly is not available in Cookie, setting it to False
         "secure": cookie.secure,
         "comment": cookie.comment or "",
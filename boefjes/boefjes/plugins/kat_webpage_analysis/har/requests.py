@@ -11,6 +11,9 @@ from typing import Any, AnyStr
 import requests
 import requests.cookies
 
+# Resolving the local timezone is surprisingly expensive; do it once instead of per cookie
+LOCAL_TIMEZONE = datetime.now().astimezone().tzinfo
+
 
 def create_har_object(response: requests.Response) -> dict:
     return {
@@ -20,7 +23,7 @@ def create_har_object(response: requests.Response) -> dict:
             "browser": {"name": "requests", "version": requests.__version__},
             "entries": [
                 {
-                    "startedDateTime": datetime.now().astimezone().isoformat(),
+                    "startedDateTime": datetime.now(tz=LOCAL_TIMEZONE).isoformat(),
                     "time": 0,
                     "request": map_request(response.request),
                     "response": map_response(response),
@@ -85,7 +88,7 @@ def map_cookie(cookie: Cookie) -> dict:
         "value": cookie.value,
         "path": cookie.path,
         "domain": cookie.domain,
-        "expires": (datetime.fromtimestamp(cookie.expires).astimezone().isoformat() if cookie.expires else None),
+        "expires": (datetime.fromtimestamp(cookie.expires, tz=LOCAL_TIMEZONE).isoformat() if cookie.expires else None),
         "httpOnly": cookie._rest.get("HttpOnly", False),  # type: ignore
         "secure": cookie.secure,
         "comment": cookie.comment or "",
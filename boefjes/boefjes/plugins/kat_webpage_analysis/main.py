@@ -1,9 +1,9 @@
 import ipaddress
-import json
 import mimetypes
 from os import getenv
 from urllib.parse import urlparse, urlunsplit
 
+import orjson
 import requests
 from forcediphttpsadapter.adapters import ForcedIPHTTPSAdapter
 from requests import Session
@@ -59,11 +59,12 @@ def run(boefje_meta: dict) -> list[tuple[set, bytes | str]]:
         if content_type_splitted[0] in ALLOWED_CONTENT_TYPES:
             body_mimetypes.add(content_type_splitted[0])
 
-    har = json.dumps(create_har_object(response))
+    # orjson serializes straight to bytes, which is what the raw file interface expects anyway
+    har = orjson.dumps(create_har_object(response))
 
     return [
-        ({"application/json+har"}, har.encode()),
-        ({"openkat-http/headers"}, json.dumps(dict(response.headers))),
+        ({"application/json+har"}, har),
+        ({"openkat-http/headers"}, orjson.dumps(dict(response.headers))),
         (body_mimetypes, response.content),
     ]
 
@@ -1,7 +1,7 @@
 import uuid
 from typing import Any
 
-from httpx import Client, HTTPTransport, Response
+from httpx import Client, HTTPTransport, Limits, Response
 from pydantic import TypeAdapter
 
 # A deliberate relative import to make this module self-contained
@@ -17,7 +17,13 @@ class BoefjeAPIClient(SchedulerClientInterface, BoefjeStorageInterface):
         oci_images: list[str] | None = None,
         plugins: list[str] | None = None,
     ):
-        self._session = Client(base_url=base_url, transport=HTTPTransport(retries=6), timeout=outgoing_request_timeout)
+        self._session = Client(
+            base_url=base_url,
+            transport=HTTPTransport(retries=6),
+            timeout=outgoing_request_timeout,
+            # Workers poll and push continuously, so keep connections alive between requests
+            limits=Limits(max_keepalive_connections=20, keepalive_expiry=30),
+        )
         self.oci_images = oci_images
         self.plugins = plugins
 
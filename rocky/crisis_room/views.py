@@ -317,7 +317,10 @@ class CrisisRoomView(TemplateView):
         )
 
     def get_user_organizations(self) -> list[Organization]:
-        return [member.organization for member in OrganizationMember.objects.filter(user=self.request.user)]
+        return [
+            member.organization
+            for member in OrganizationMember.objects.filter(user=self.request.user).select_related("organization")
+        ]
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -11,7 +11,8 @@ from tools.forms.ooi import SelectOOIFilterForm, SelectOOIForm
 
 from katalogus.client import Boefje, Normalizer
 from katalogus.views.plugin_settings_list import PluginSettingsListView
-from octopoes.models import ScanLevel
+from octopoes.models import Reference, ScanLevel
+from octopoes.models.exception import ObjectNotFoundException
 from octopoes.models.types import OOIType
 from rocky.scheduler import ScheduleResponse
 from rocky.views.tasks import TaskListView
@@ -33,7 +34,7 @@ class PluginDetailView(TaskListView, PluginSettingsListView):
 
             if selected_oois and self.plugin.id:
                 oois = self.get_oois(selected_oois)
-                boefje = self.katalogus_client.get_plugin(self.plugin.id)
+                boefje = self.plugin  # already fetched from the KATalogus in setup()
 
                 oois_with_clearance_level = oois["oois_with_clearance"]
                 oois_without_clearance_level = oois["oois_without_clearance"]
@@ -75,9 +76,19 @@ class PluginDetailView(TaskListView, PluginSettingsListView):
     def get_oois(self, selected_oois: list[str]) -> dict[str, Any]:
         oois_with_clearance = []
         oois_without_clearance = []
-        for ooi in selected_oois:
-            ooi_object = self.get_single_ooi(pk=ooi)
-
+        references = {Reference.from_str(ooi) for ooi in selected_oois}
+        try:
+            # One bulk load instead of a roundtrip per selected OOI
+            ooi_objects = self.octopoes_api_connector.load_objects_bulk(references, valid_time=self.observed_at)
+        except Exception as e:
+            self.handle_connector_exception(e)
+
+        # load_objects_bulk silently omits unknown references; keep the 404 the
+        # per-OOI fetches used to raise for stale selections
+        if missing := references - ooi_objects.keys():
+            self.handle_connector_exception(ObjectNotFoundException(", ".join(sorted(str(ref) for ref in missing))))
+
+        for ooi_object in ooi_objects.values():
             if ooi_object.scan_profile and ooi_object.scan_profile.level >= self.plugin.scan_level.value:
                 oois_with_clearance.append(ooi_object)
             else:
@@ -133,7 +144,7 @@ class BoefjeDetailView(PluginDetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context["new_variant"] = self.request.GET.get("new_variant")
-        context["variants"] = self.get_katalogus().get_plugins(oci_image=self.plugin.oci_image)
+        context["variants"] = self.katalogus_client.get_plugins(oci_image=self.plugin.oci_image)
 
         for variant in context["variants"]:
             if variant.created:
@@ -219,7 +219,7 @@ class OOIList:
         self.ooi_types = ooi_types
         self.valid_time = valid_time
         self.ordered = True
-        self._count = 0
+        self._count: int | None = None
         self.scan_level = scan_level
         self.scan_profile_type = scan_profile_type
         self.search_string = search_string
@@ -230,14 +230,16 @@ class OOIList:
     def count(self) -> int:
         if not self.ooi_types:
             return 0
-        return self.octopoes_connector.list_objects(
-            self.ooi_types,
-            valid_time=self.valid_time,
-            limit=0,
-            scan_level=self.scan_level,
-            scan_profile_type=self.scan_profile_type,
-            search_string=self.search_string,
-        ).count
+        if self._count is None:
+            self._count = self.octopoes_connector.list_objects(
+                self.ooi_types,
+                valid_time=self.valid_time,
+                limit=0,
+                scan_level=self.scan_level,
+                scan_profile_type=self.scan_profile_type,
+                search_string=self.search_string,
+            ).count
+        return self._count
 
     def __len__(self):
         return self.count
@@ -251,7 +253,7 @@ class OOIList:
             if key.stop:
                 limit = key.stop - offset
 
-            return self.octopoes_connector.list_objects(
+            paginated = self.octopoes_connector.list_objects(
                 self.ooi_types,
                 valid_time=self.valid_time,
                 offset=offset,
@@ -261,7 +263,11 @@ class OOIList:
                 search_string=self.search_string,
                 order_by=self.order_by,
                 asc_desc=self.asc_desc,
-            ).items
+            )
+            # The page response already carries the total, so remember it to save the count query
+            self._count = paginated.count
+
+            return paginated.items
 
         elif isinstance(key, int):
             return self.octopoes_connector.list_objects(
@@ -304,14 +310,16 @@ class FindingList:
 
     @cached_property
     def count(self) -> int:
-        return self.octopoes_connector.list_findings(
-            severities=self.severities,
-            valid_time=self.valid_time,
-            exclude_muted=self.exclude_muted,
-            only_muted=self.only_muted,
-            limit=0,
-            search_string=self.search_string,
-        ).count
+        if self._count is None:
+            self._count = self.octopoes_connector.list_findings(
+                severities=self.severities,
+                valid_time=self.valid_time,
+                exclude_muted=self.exclude_muted,
+                only_muted=self.only_muted,
+                limit=0,
+                search_string=self.search_string,
+            ).count
+        return self._count
 
     def __len__(self):
         return self.count
@@ -322,7 +330,7 @@ class FindingList:
             limit = self.HARD_LIMIT
             if key.stop:
                 limit = key.stop - offset
-            findings = self.octopoes_connector.list_findings(
+            paginated = self.octopoes_connector.list_findings(
                 severities=self.severities,
                 valid_time=self.valid_time,
                 exclude_muted=self.exclude_muted,
@@ -332,7 +340,9 @@ class FindingList:
                 search_string=self.search_string,
                 order_by=self.order_by,
                 asc_desc=self.asc_desc,
-            ).items
+            )
+            self._count = paginated.count
+            findings = paginated.items
             ooi_references = {finding.ooi for finding in findings}
             finding_type_references = {finding.finding_type for finding in findings}
             objects = self.octopoes_connector.load_objects_bulk(
@@ -385,7 +395,9 @@ class ReportList:
     def count(self) -> int:
         if self.asset_reports is not None:
             return len(self.asset_reports)
-        return self.octopoes_connector.list_reports(valid_time=self.valid_time, limit=0).count
+        if self._count is None:
+            self._count = self.octopoes_connector.list_reports(valid_time=self.valid_time, limit=0).count
+        return self._count
 
     def __len__(self):
         return self.count
@@ -400,9 +412,10 @@ class ReportList:
             if self.asset_reports is not None:
                 return self.asset_reports[offset : offset + limit]
 
-            reports = self.octopoes_connector.list_reports(valid_time=self.valid_time, offset=offset, limit=limit).items
+            paginated = self.octopoes_connector.list_reports(valid_time=self.valid_time, offset=offset, limit=limit)
+            self._count = paginated.count
 
-            return self.enriched_report_list(reports)
+            return self.enriched_report_list(paginated.items)
 
         raise NotImplementedError("ReportList only supports slicing")
 
@@ -18,6 +18,7 @@ from django.conf import settings
 from django.contrib.auth.models import Group, Permission
 from django.contrib.messages.middleware import MessageMiddleware
 from django.contrib.sessions.middleware import SessionMiddleware
+from django.test import RequestFactory
 from django.utils.translation import activate, deactivate
 from django_otp import DEVICE_ID_SESSION_KEY
 from django_otp.middleware import OTPMiddleware
@@ -66,6 +67,13 @@ def fixture_configure_structlog(log_output):
     structlog.configure(processors=[log_output])
 
 
+@pytest.fixture(scope="session")
+def rf():
+    # RequestFactory is stateless, so one instance can serve the whole session
+    # instead of pytest-django building one per test
+    return RequestFactory()
+
+
 @pytest.fixture
 def valid_time():
     return datetime.now(timezone.utc)
@@ -13,36 +13,25 @@ def test_indemnification_present(superuser_member):
     assert superuser_member.user.indemnification_set.exists()
 
 
-def test_account_detail_perms(rf, superuser_member, admin_member, redteam_member, client_member):
-    response_superuser = AccountView.as_view()(
-        setup_request(rf.get("account_detail"), superuser_member.user),
-        organization_code=superuser_member.organization.code,
-    )
-
-    response_admin = AccountView.as_view()(
-        setup_request(rf.get("account_detail"), admin_member.user), organization_code=admin_member.organization.code
-    )
-
-    response_redteam = AccountView.as_view()(
-        setup_request(rf.get("account_detail"), redteam_member.user), organization_code=redteam_member.organization.code
-    )
+@pytest.mark.parametrize(
+    ("member", "has_clearance_section"),
+    [("superuser_member", True), ("admin_member", False), ("redteam_member", True), ("client_member", False)],
+)
+def test_account_detail_perms(request, member, has_clearance_section, rf):
+    member = request.getfixturevalue(member)
 
-    response_client = AccountView.as_view()(
-        setup_request(rf.get("account_detail"), client_member.user), organization_code=client_member.organization.code
+    response = AccountView.as_view()(
+        setup_request(rf.get("account_detail"), member.user), organization_code=member.organization.code
     )
-    assert response_superuser.status_code == 200
-    assert response_admin.status_code == 200
-    assert response_redteam.status_code == 200
-    assert response_client.status_code == 200
+    assert response.status_code == 200
 
     # There is already text having OOI clearance outside the perms sections, so header tags must be included
     check_text = "<h2>OOI clearance</h2>"
 
-    assertContains(response_superuser, check_text)
-    assertContains(response_redteam, check_text)
-
-    assertNotContains(response_admin, check_text)
-    assertNotContains(response_client, check_text)
+    if has_clearance_section:
+        assertContains(response, check_text)
+    else:
+        assertNotContains(response, check_text)
 
 
 @pytest.mark.parametrize("member", ["superuser_member", "redteam_member"])
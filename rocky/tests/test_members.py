@@ -8,12 +8,22 @@ from rocky.views.organization_member_edit import OrganizationMemberEditView
 from tests.conftest import setup_request
 
 
-def test_admin_can_edit_itself(rf, admin_member):
+@pytest.fixture
+def edit_request(rf):
+    """Build the member edit GET request every test in this module starts from."""
+
+    def _make(user):
+        return setup_request(rf.get("organization_member_edit"), user)
+
+    return _make
+
+
+def test_admin_can_edit_itself(edit_request, admin_member):
     """
     This will test if an admin member can edit itself.
     """
 
-    request = setup_request(rf.get("organization_member_edit"), admin_member.user)
+    request = edit_request(admin_member.user)
     response = OrganizationMemberEditView.as_view()(
         request, organization_code=admin_member.organization.code, pk=admin_member.id
     )
@@ -21,12 +31,12 @@ def test_admin_can_edit_itself(rf, admin_member):
     assertContains(response, "Edit member")
 
 
-def test_superuser_can_edit_itself(rf, superuser_member):
+def test_superuser_can_edit_itself(edit_request, superuser_member):
     """
     This will test if a superuser can edit itself.
     """
 
-    request = setup_request(rf.get("organization_member_edit"), superuser_member.user)
+    request = edit_request(superuser_member.user)
     response = OrganizationMemberEditView.as_view()(
         request, organization_code=superuser_member.organization.code, pk=superuser_member.id
     )
@@ -34,84 +44,84 @@ def test_superuser_can_edit_itself(rf, superuser_member):
     assertContains(response, "Edit member")
 
 
-def test_client_can_edit_itself(rf, client_member):
+def test_client_can_edit_itself(edit_request, client_member):
     """
     This will test if a client member can edit itself. Only admins and superusers have edit rights.
     """
 
-    request = setup_request(rf.get("organization_member_edit"), client_member.user)
+    request = edit_request(client_member.user)
     with pytest.raises(PermissionDenied):
         OrganizationMemberEditView.as_view()(
             request, organization_code=client_member.organization.code, pk=client_member.id
         )
 
 
-def test_redteam_can_edit_itself(rf, redteam_member):
+def test_redteam_can_edit_itself(edit_request, redteam_member):
     """
     This will test if a redteam member can edit itself. Only admins and supersuers have edit rights.
     """
 
-    request = setup_request(rf.get("organization_member_edit"), redteam_member.user)
+    request = edit_request(redteam_member.user)
     with pytest.raises(PermissionDenied):
         OrganizationMemberEditView.as_view()(
             request, organization_code=redteam_member.organization.code, pk=redteam_member.id
         )
 
 
-def test_admin_can_edit_superuser(rf, admin_member, superuser_member):
+def test_admin_can_edit_superuser(edit_request, admin_member, superuser_member):
     """
     This will test if admin can edit superuser at the member edit view.
     """
 
-    request = setup_request(rf.get("organization_member_edit"), admin_member.user)
+    request = edit_request(admin_member.user)
     with pytest.raises(PermissionDenied):
         OrganizationMemberEditView.as_view()(
             request, organization_code=superuser_member.organization.code, pk=superuser_member.id
         )
 
 
-def test_client_can_edit_superuser(rf, client_member, superuser_member):
+def test_client_can_edit_superuser(edit_request, client_member, superuser_member):
     """
     This will test if client can edit superuser at the member edit view.
     """
 
-    request = setup_request(rf.get("organization_member_edit"), client_member.user)
+    request = edit_request(client_member.user)
     with pytest.raises(PermissionDenied):
         OrganizationMemberEditView.as_view()(
             request, organization_code=superuser_member.organization.code, pk=superuser_member.id
         )
 
 
-def test_redteamer_can_edit_superuser(rf, redteam_member, superuser_member, organization):
+def test_redteamer_can_edit_superuser(edit_request, redteam_member, superuser_member, organization):
     """
     This will test if redteamer can edit superuser at the member edit view.
     """
 
-    request = setup_request(rf.get("organization_member_edit"), redteam_member.user)
+    request = edit_request(redteam_member.user)
     with pytest.raises(PermissionDenied):
         OrganizationMemberEditView.as_view()(request, organization_code=organization.code, pk=superuser_member.id)
 
 
-def test_edit_superusers_from_different_organizations(rf, superuser_member, superuser_member_b):
+def test_edit_superusers_from_different_organizations(edit_request, superuser_member, superuser_member_b):
     """
     This will test if a superuser from one organization can edit
     a superuser from another organization at the member edit view.
     """
 
-    request = setup_request(rf.get("organization_member_edit"), superuser_member.user)
+    request = edit_request(superuser_member.user)
     # from OrganizationView
     OrganizationMemberEditView.as_view()(
         request, organization_code=superuser_member_b.organization.code, pk=superuser_member_b.id
     )
 
 
-def test_edit_admins_from_different_organizations(rf, admin_member, admin_member_b):
+def test_edit_admins_from_different_organizations(edit_request, admin_member, admin_member_b):
     """
     This will check that an admin from one organization cannot edit
     an admin from another organization at the member edit view.
     """
 
-    request = setup_request(rf.get("organization_member_edit"), admin_member.user)
+    request = edit_request(admin_member.user)
     # from OrganizationView
     with pytest.raises(Http404):
         OrganizationMemberEditView.as_view()(
@@ -8,11 +8,11 @@ Usage:
 """
 
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
-from httpx import HTTPError
 from katalogus.client import get_katalogus_client
 
 from octopoes.connector.octopoes import OctopoesAPIConnector
@@ -22,7 +22,7 @@ from octopoes.models.ooi.network import Network
 from octopoes.models.ooi.web import URL
 from rocky.bytes_client import get_bytes_client
 from tools.models import Indemnification, Organization, OrganizationMember
-from tools.ooi_helpers import create_ooi
+from tools.ooi_helpers import create_oois
 
 User = get_user_model()
 
@@ -154,44 +154,29 @@ class Command(BaseCommand):
 
         valid_time = datetime.datetime.now(datetime.timezone.utc)
 
-        # Network (usually already seeded by organization creation signal)
+        # The network is usually already seeded by the organization creation signal
         network = Network(name="internet")
-        try:
-            create_ooi(octopoes, bytes_client, network, valid_time)
-            self.stdout.write("  ✓ Network: internet")
-        except Exception as e:
-            self.stdout.write(self.style.WARNING(f"  ⚠ Network: {e}"))
-
-        # Hostname
-        host = Hostname(name=hostname, network=network.reference)
-        try:
-            create_ooi(octopoes, bytes_client, host, valid_time)
-            self.stdout.write(f"  ✓ Hostname: {hostname}")
-        except Exception as e:
-            self.stdout.write(self.style.WARNING(f"  ⚠ Hostname: {e}"))
-
-        # www subdomain
-        www_host = Hostname(name=f"www.{hostname}", network=network.reference)
-        try:
-            create_ooi(octopoes, bytes_client, www_host, valid_time)
-            self.stdout.write(f"  ✓ Hostname: www.{hostname}")
-        except Exception as e:
-            self.stdout.write(self.style.WARNING(f"  ⚠ www.{hostname}: {e}"))
+        network_reference = network.reference
+        host = Hostname(name=hostname, network=network_reference)
+        www_host = Hostname(name=f"www.{hostname}", network=network_reference)
+        url = URL(raw=f"https://{hostname}/", network=network_reference)
+        oois = [network, host, www_host, url]
 
-        # URL
-        url = URL(raw=f"https://{hostname}/", network=network.reference)
         try:
-            create_ooi(octopoes, bytes_client, url, valid_time)
-            self.stdout.write(f"  ✓ URL: https://{hostname}/")
+            # One bulk declaration (and one proof upload to Bytes) instead of a roundtrip per OOI
+            create_oois(octopoes, bytes_client, oois, valid_time)
+            for ooi in oois:
+                self.stdout.write(f"  ✓ {ooi.human_readable}")
         except Exception as e:
-            self.stdout.write(self.style.WARNING(f"  ⚠ URL: {e}"))
+            self.stdout.write(self.style.WARNING(f"  ⚠ OOIs: {e}"))
 
         # Set clearance level on the hostname (not on network)
         if clearance_level > 0:
+            host_reference = host.reference
             try:
-                scan_profile = DeclaredScanProfile(reference=host.reference, level=ScanLevel(clearance_level))
+                scan_profile = DeclaredScanProfile(reference=host_reference, level=ScanLevel(clearance_level))
                 octopoes.save_scan_profile(scan_profile, valid_time)
-                self.stdout.write(f"  ✓ Set clearance level {clearance_level} on {host.reference}")
+                self.stdout.write(f"  ✓ Set clearance level {clearance_level} on {host_reference}")
             except Exception as e:
                 self.stdout.write(self.style.WARNING(f"  ⚠ Clearance level: {e}"))
 
@@ -216,11 +201,18 @@ class Command(BaseCommand):
 
         katalogus = get_katalogus_client()
 
-        for boefje_id in boefjes:
+        def enable(boefje_id: str) -> tuple[str, Exception | None]:
             try:
                 katalogus.enable_boefje_by_id(org_code, boefje_id)
-                self.stdout.write(f"  ✓ {boefje_id}")
-            except HTTPError as e:
-                self.stdout.write(self.style.WARNING(f"  ⚠ {boefje_id}: {e}"))
+                return boefje_id, None
             except Exception as e:
-                self.stdout.write(self.style.WARNING(f"  ⚠ {boefje_id}: {e}"))
+                return boefje_id, e
+
+        # There is no bulk-enable endpoint, so fire the requests concurrently: the
+        # wall-clock cost becomes one roundtrip instead of one per boefje
+        with ThreadPoolExecutor(max_workers=len(boefjes)) as executor:
+            for boefje_id, error in executor.map(enable, boefjes):
+                if error is None:
+                    self.stdout.write(f"  ✓ {boefje_id}")
+                else:
+                    self.stdout.write(self.style.WARNING(f"  ⚠ {boefje_id}: {error}"))